@@ -5,19 +5,119 @@ Converts JSON system reports to beautiful HTML webpages
 
 Usage:
     python report_converter.py [input.json] [output.html]
+    python report_converter.py --batch <folder>
     
+Batch mode converts every JSON report in a folder in a single run.
+
 If no arguments provided, interactive mode will guide you through the process.
 """
 
-import json
 import sys
 import os
-import glob
+import stat
+from html import escape
 from datetime import datetime
-from pathlib import Path
+
+# Use orjson for parsing when available (much faster on large reports),
+# otherwise fall back to the standard library
+try:
+    import orjson
+    
+    parse_json = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    
+    def parse_json(raw):
+        return json.loads(raw.decode('utf-8'))
+    
+    JSONDecodeError = json.JSONDecodeError
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Pre-rendered markup for the common service status
+SERVICE_STATUS_HTML = {
+    'Running': '<span class="status-running">✅ Running</span>'
+}
+
+# Markup for a single property row, filled in with str.format
+PROPERTY_TEMPLATE = '''
+                <div class="property">
+                    <div class="property-name">{}:</div>
+                    <div class="property-value">{}</div>
+                </div>
+            '''
+render_property = PROPERTY_TEMPLATE.format
+
+# Icons shown in each section header
+SECTION_ICONS = {
+    'System': '🖥️',
+    'Network': '🌐',
+    'CPU': '⚡',
+    'Memory': '🧠',
+    'Disk': '💾',
+    'Graphics': '🎮',
+    'Software': '📦',
+    'Services': '⚙️'
+}
+section_icon = SECTION_ICONS.get
+
+# Opening and closing markup for each expandable section
+SECTION_HEADER_TEMPLATE = '''
+        <div class="section">
+            <div class="section-header" onclick="toggleSection(this)">
+                <span>{} {} Information</span>
+                <span class="toggle-icon">▼</span>
+            </div>
+            <div class="section-content">
+        '''
+render_section_header = SECTION_HEADER_TEMPLATE.format
+
+SECTION_FOOTER = '''
+            </div>
+        </div>
+        '''
+
+# Translation table that drops digits from property names (Processor1 -> Processor)
+DIGIT_STRIP_TABLE = str.maketrans('', '', '0123456789')
+
+def load_json_file(json_file_path):
+    """Read a JSON report, stripping the UTF-8 BOM that PowerShell writes"""
+    with open(json_file_path, 'rb') as f:
+        raw = f.read()
+    
+    if raw.startswith(UTF8_BOM):
+        raw = raw[len(UTF8_BOM):]
+    
+    return parse_json(raw)
+
+def scan_json_dir(path):
+    """Return (path, stat_result) pairs for every JSON file in a folder
+    
+    Raises OSError if the folder cannot be read.
+    """
+    found = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.json') and entry.is_file():
+                found.append((entry.path, entry.stat()))
+    return found
+
+def is_json_file(path):
+    """Check that a path names an existing regular .json file (single stat call)"""
+    if not path.lower().endswith('.json'):
+        return False
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
 
 def find_json_files():
-    """Find JSON files in common locations"""
+    """Find JSON files in common locations
+    
+    Returns a list of (path, stat_result) tuples so callers can reuse the
+    size and modification time without stat-ing each file again.
+    """
     common_paths = [
         ".",  # Current directory
         "C:\\temp",
@@ -26,19 +126,17 @@ def find_json_files():
         os.path.expanduser("~/Documents")
     ]
     
-    json_files = []
+    # Remove duplicates (dict keeps first occurrence) and sort by modification time (newest first)
+    json_files = {}
     for path in common_paths:
         try:
-            if os.path.exists(path):
-                json_files.extend(glob.glob(os.path.join(path, "*.json")))
-        except:
+            folder_files = scan_json_dir(path)
+        except OSError:
             continue
+        for file, file_stat in folder_files:
+            json_files.setdefault(file, file_stat)
     
-    # Remove duplicates and sort by modification time (newest first)
-    json_files = list(set(json_files))
-    json_files.sort(key=os.path.getmtime, reverse=True)
-    
-    return json_files
+    return sorted(json_files.items(), key=lambda item: item[1].st_mtime, reverse=True)
 
 def get_input_file():
     """Interactive prompt for input file"""
@@ -47,10 +145,10 @@ def get_input_file():
     
     if json_files:
         print(f"\n📁 Found {len(json_files)} JSON files:")
-        for i, file in enumerate(json_files[:10], 1):  # Show max 10 files
+        for i, (file, file_stat) in enumerate(json_files[:10], 1):  # Show max 10 files
             try:
-                size = os.path.getsize(file) / 1024  # Size in KB
-                modified = datetime.fromtimestamp(os.path.getmtime(file)).strftime("%Y-%m-%d %H:%M")
+                size = file_stat.st_size / 1024  # Size in KB
+                modified = datetime.fromtimestamp(file_stat.st_mtime).strftime("%Y-%m-%d %H:%M")
                 print(f"  {i}. {os.path.basename(file)} ({size:.1f} KB, {modified})")
                 print(f"     📂 {os.path.dirname(file)}")
             except:
@@ -60,8 +158,9 @@ def get_input_file():
         if len(json_files) > 10:
             print(f"     ... and {len(json_files) - 10} more files")
         
+        max_selection = min(10, len(json_files))
         print(f"\n💡 You can:")
-        print(f"   • Enter a number (1-{min(10, len(json_files))}) to select from the list above")
+        print(f"   • Enter a number (1-{max_selection}) to select from the list above")
         print(f"   • Enter the full path to any JSON file")
         print(f"   • Drag and drop a file into this window")
         
@@ -69,16 +168,19 @@ def get_input_file():
             user_input = input(f"\n📥 Select JSON file: ").strip().strip('"')
             
             # Check if it's a number selection
-            if user_input.isdigit():
+            try:
                 selection = int(user_input)
-                if 1 <= selection <= min(10, len(json_files)):
-                    return json_files[selection - 1]
-                else:
-                    print(f"❌ Please enter a number between 1 and {min(10, len(json_files))}")
-                    continue
+            except ValueError:
+                selection = None
+            
+            if selection is not None:
+                if 1 <= selection <= max_selection:
+                    return json_files[selection - 1][0]
+                print(f"❌ Please enter a number between 1 and {max_selection}")
+                continue
             
             # Check if it's a file path
-            if os.path.exists(user_input) and user_input.lower().endswith('.json'):
+            if is_json_file(user_input):
                 return user_input
             
             print(f"❌ File not found or not a JSON file. Please try again.")
@@ -89,12 +191,14 @@ def get_input_file():
         
         while True:
             user_input = input("📥 JSON file path: ").strip().strip('"')
-            if os.path.exists(user_input) and user_input.lower().endswith('.json'):
+            if is_json_file(user_input):
                 return user_input
             print("❌ File not found or not a JSON file. Please try again.")
 
 def get_output_file(input_file):
     """Interactive prompt for output file"""
+    from pathlib import Path  # Only needed in interactive mode
+    
     input_path = Path(input_file)
     suggested_name = f"{input_path.stem}_report.html"
     suggested_path = input_path.parent / suggested_name
@@ -114,17 +218,20 @@ def get_output_file(input_file):
     
     return user_input
 
-def format_property_value(value, category, key):
-    """Format property values with special styling for certain types"""
-    if category == 'Services':
-        if value == 'Running':
-            return f'<span class="status-running">✅ {value}</span>'
-        else:
-            return f'<span class="status-stopped">❌ {value}</span>'
-    
-    # Escape HTML characters
+def format_service_status(value):
+    """Format a service status as a coloured badge"""
+    status_html = SERVICE_STATUS_HTML.get(value) if isinstance(value, str) else None
+    if status_html is not None:
+        return status_html
+    return f'<span class="status-stopped">❌ {escape(str(value), quote=False)}</span>'
+
+def format_plain_value(value):
+    """Format a generic property value as escaped text"""
+    # Escape HTML characters (most values contain none, so skip the copy)
     if isinstance(value, str):
-        value = value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        if '&' in value or '<' in value or '>' in value:
+            return escape(value, quote=False)
+        return value
     
     return str(value)
 
@@ -132,26 +239,27 @@ def generate_summary_section(data):
     """Generate a summary section with key metrics"""
     summary_items = []
     
-    # Extract key information for summary
+    # Extract key information for summary (each section is looked up once)
     try:
-        if 'System' in data:
-            if 'ComputerName' in data['System']:
-                summary_items.append(f'<div class="summary-item"><h4>Computer</h4><div class="value">{data["System"]["ComputerName"]}</div></div>')
-            if 'OSVersion' in data['System']:
-                summary_items.append(f'<div class="summary-item"><h4>Operating System</h4><div class="value">{data["System"]["OSVersion"]}</div></div>')
+        system = data.get('System', {})
+        if 'ComputerName' in system:
+            summary_items.append(f'<div class="summary-item"><h4>Computer</h4><div class="value">{system["ComputerName"]}</div></div>')
+        if 'OSVersion' in system:
+            summary_items.append(f'<div class="summary-item"><h4>Operating System</h4><div class="value">{system["OSVersion"]}</div></div>')
         
-        if 'Memory' in data:
-            if 'TotalRAM' in data['Memory']:
-                summary_items.append(f'<div class="summary-item"><h4>Total RAM</h4><div class="value">{data["Memory"]["TotalRAM"]}</div></div>')
+        memory = data.get('Memory', {})
+        if 'TotalRAM' in memory:
+            summary_items.append(f'<div class="summary-item"><h4>Total RAM</h4><div class="value">{memory["TotalRAM"]}</div></div>')
         
-        if 'CPU' in data:
-            if 'Processor1' in data['CPU']:
-                cpu_name = data['CPU']['Processor1'].split('(')[0].strip()  # Clean up CPU name
-                summary_items.append(f'<div class="summary-item"><h4>Processor</h4><div class="value">{cpu_name}</div></div>')
+        cpu = data.get('CPU', {})
+        if 'Processor1' in cpu:
+            cpu_name = cpu['Processor1'].partition('(')[0].strip()  # Clean up CPU name
+            summary_items.append(f'<div class="summary-item"><h4>Processor</h4><div class="value">{cpu_name}</div></div>')
         
         if 'Services' in data:
-            running_services = sum(1 for service in data['Services'].values() if service == 'Running')
-            total_services = len(data['Services'])
+            services = data['Services']
+            total_services = len(services)
+            running_services = list(services.values()).count('Running')
             summary_items.append(f'<div class="summary-item"><h4>Services Status</h4><div class="value">{running_services}/{total_services} Running</div></div>')
     
     except Exception as e:
@@ -168,129 +276,93 @@ def generate_summary_section(data):
     return ""
 
 def generate_sections(data):
-    """Generate all the expandable sections"""
-    sections_html = []
-    
-    # Define section icons
-    section_icons = {
-        'System': '🖥️',
-        'Network': '🌐',
-        'CPU': '⚡',
-        'Memory': '🧠',
-        'Disk': '💾',
-        'Graphics': '🎮',
-        'Software': '📦',
-        'Services': '⚙️'
-    }
+    """Generate all the expandable sections as a list of HTML fragments"""
+    parts = []
     
+    # Bind the hot-loop append to a local once
+    append = parts.append
     for category, properties in data.items():
-        icon = section_icons.get(category, '📋')
-        section_html = f'''
-        <div class="section">
-            <div class="section-header" onclick="toggleSection(this)">
-                <span>{icon} {category} Information</span>
-                <span class="toggle-icon">▼</span>
-            </div>
-            <div class="section-content">
-        '''
+        append(render_section_header(section_icon(category, '📋'), category))
+        
+        # Pick the value formatter once per section rather than per property
+        format_value = format_service_status if category == 'Services' else format_plain_value
         
         for key, value in properties.items():
             # Clean up property names
-            clean_key = key.replace('1', '').replace('2', '').replace('3', '').replace('4', '').replace('5', '')
-            clean_key = clean_key.replace('_', ' ').strip()
+            clean_key = key.translate(DIGIT_STRIP_TABLE).replace('_', ' ').strip()
             
-            # Format values based on category and content
-            formatted_value = format_property_value(value, category, key)
-            
-            section_html += f'''
-                <div class="property">
-                    <div class="property-name">{clean_key}:</div>
-                    <div class="property-value">{formatted_value}</div>
-                </div>
-            '''
+            append(render_property(clean_key, format_value(value)))
         
-        section_html += '''
-            </div>
-        </div>
-        '''
-        sections_html.append(section_html)
+        append(SECTION_FOOTER)
     
-    return ''.join(sections_html)
+    # Leave the fragments unjoined so they can be encoded and written one by one
+    return parts
 
-def generate_html_template(data, computer_name, timestamp):
-    """Generate the complete HTML report"""
-    
-    html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>System Report - {computer_name}</title>
-    <style>
-        * {{
+# Static stylesheet and script shared by every report
+REPORT_STYLE = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: #ffffff;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
             color: white;
             padding: 40px 30px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             font-weight: 300;
-        }}
+        }
         
-        .header .subtitle {{
+        .header .subtitle {
             font-size: 1.1em;
             opacity: 0.9;
             margin-bottom: 20px;
-        }}
+        }
         
-        .header .timestamp {{
+        .header .timestamp {
             background: rgba(255,255,255,0.1);
             padding: 8px 16px;
             border-radius: 20px;
             display: inline-block;
             font-size: 0.9em;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 30px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 25px;
             border-radius: 10px;
             overflow: hidden;
             box-shadow: 0 4px 6px rgba(0,0,0,0.05);
             border: 1px solid #e1e8ed;
-        }}
+        }
         
-        .section-header {{
+        .section-header {
             background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
             color: white;
             padding: 20px 25px;
@@ -301,40 +373,40 @@ def generate_html_template(data, computer_name, timestamp):
             justify-content: space-between;
             align-items: center;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .section-header:hover {{
+        .section-header:hover {
             background: linear-gradient(135deg, #2980b9 0%, #3498db 100%);
             transform: translateY(-1px);
-        }}
+        }
         
-        .section-header.active {{
+        .section-header.active {
             background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%);
-        }}
+        }
         
-        .toggle-icon {{
+        .toggle-icon {
             font-size: 1.2em;
             transition: transform 0.3s ease;
-        }}
+        }
         
-        .toggle-icon.rotated {{
+        .toggle-icon.rotated {
             transform: rotate(180deg);
-        }}
+        }
         
-        .section-content {{
+        .section-content {
             padding: 0;
             max-height: 0;
             overflow: hidden;
             transition: all 0.4s ease;
             background: #f8f9fa;
-        }}
+        }
         
-        .section-content.expanded {{
+        .section-content.expanded {
             padding: 25px;
             max-height: 2000px;
-        }}
+        }
         
-        .property {{
+        .property {
             display: flex;
             margin-bottom: 15px;
             padding: 12px 16px;
@@ -342,86 +414,86 @@ def generate_html_template(data, computer_name, timestamp):
             border-radius: 8px;
             border-left: 4px solid #3498db;
             transition: all 0.2s ease;
-        }}
+        }
         
-        .property:hover {{
+        .property:hover {
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             transform: translateX(2px);
-        }}
+        }
         
-        .property-name {{
+        .property-name {
             font-weight: 600;
             min-width: 200px;
             color: #2c3e50;
             margin-right: 20px;
-        }}
+        }
         
-        .property-value {{
+        .property-value {
             color: #34495e;
             flex: 1;
             word-break: break-word;
-        }}
+        }
         
-        .status-running {{
+        .status-running {
             color: #27ae60;
             font-weight: bold;
             padding: 4px 8px;
             background: #d5f4e6;
             border-radius: 12px;
             font-size: 0.9em;
-        }}
+        }
         
-        .status-stopped {{
+        .status-stopped {
             color: #e74c3c;
             font-weight: bold;
             padding: 4px 8px;
             background: #fdeaea;
             border-radius: 12px;
             font-size: 0.9em;
-        }}
+        }
         
-        .summary {{
+        .summary {
             background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%);
             color: white;
             padding: 20px;
             margin-bottom: 30px;
             border-radius: 10px;
             text-align: center;
-        }}
+        }
         
-        .summary-grid {{
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-top: 15px;
-        }}
+        }
         
-        .summary-item {{
+        .summary-item {
             background: rgba(255,255,255,0.1);
             padding: 15px;
             border-radius: 8px;
-        }}
+        }
         
-        .summary-item h4 {{
+        .summary-item h4 {
             margin-bottom: 5px;
             font-size: 0.9em;
             opacity: 0.9;
-        }}
+        }
         
-        .summary-item .value {{
+        .summary-item .value {
             font-size: 1.2em;
             font-weight: bold;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 30px;
             background: #f8f9fa;
             color: #7f8c8d;
             border-top: 1px solid #e1e8ed;
-        }}
+        }
         
-        .expand-all {{
+        .expand-all {
             background: #3498db;
             color: white;
             border: none;
@@ -431,111 +503,130 @@ def generate_html_template(data, computer_name, timestamp):
             font-size: 1em;
             margin-bottom: 20px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .expand-all:hover {{
+        .expand-all:hover {
             background: #2980b9;
             transform: translateY(-2px);
             box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .property {{
+        @media (max-width: 768px) {
+            .property {
                 flex-direction: column;
-            }}
+            }
             
-            .property-name {{
+            .property-name {
                 min-width: auto;
                 margin-bottom: 8px;
                 margin-right: 0;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 2em;
-            }}
+            }
             
-            .content {{
+            .content {
                 padding: 20px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🖥️ System Information Report</h1>
-            <p class="subtitle">Computer: <strong>{computer_name}</strong></p>
-            <div class="timestamp">Generated: {timestamp}</div>
-        </div>
-        
-        <div class="content">
-            <button class="expand-all" onclick="toggleAllSections()">📂 Expand All Sections</button>
-            
-            {generate_summary_section(data)}
-            
-            {generate_sections(data)}
-        </div>
-        
-        <div class="footer">
-            <p>Report generated by PowerShell System Information Script</p>
-            <p>Converted to HTML by Python Report Converter</p>
-        </div>
-    </div>
-    
-    <script>
-        let allExpanded = false;
+            }
+        }
+"""
+
+REPORT_SCRIPT = """        let allExpanded = false;
         
-        function toggleSection(header) {{
+        function toggleSection(header) {
             const content = header.nextElementSibling;
             const icon = header.querySelector('.toggle-icon');
             
             header.classList.toggle('active');
             content.classList.toggle('expanded');
             icon.classList.toggle('rotated');
-        }}
+        }
         
-        function toggleAllSections() {{
+        function toggleAllSections() {
             const headers = document.querySelectorAll('.section-header');
             const button = document.querySelector('.expand-all');
             
-            headers.forEach(header => {{
+            headers.forEach(header => {
                 const content = header.nextElementSibling;
                 const icon = header.querySelector('.toggle-icon');
                 
-                if (!allExpanded) {{
+                if (!allExpanded) {
                     header.classList.add('active');
                     content.classList.add('expanded');
                     icon.classList.add('rotated');
-                }} else {{
+                } else {
                     header.classList.remove('active');
                     content.classList.remove('expanded');
                     icon.classList.remove('rotated');
-                }}
-            }});
+                }
+            });
             
             allExpanded = !allExpanded;
             button.textContent = allExpanded ? '📁 Collapse All Sections' : '📂 Expand All Sections';
-        }}
+        }
         
         // Auto-expand System section
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const firstSection = document.querySelector('.section-header');
-            if (firstSection) {{
+            if (firstSection) {
                 toggleSection(firstSection);
-            }}
-        }});
-    </script>
-</body>
-</html>"""
+            }
+        });
+"""
+
+def generate_html_parts(data, computer_name, timestamp):
+    """Generate the HTML report as a list of string fragments"""
+    
+    return [f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>System Report - {computer_name}</title>
+    <style>
+""",
+        REPORT_STYLE,
+        f"""    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🖥️ System Information Report</h1>
+            <p class="subtitle">Computer: <strong>{computer_name}</strong></p>
+            <div class="timestamp">Generated: {timestamp}</div>
+        </div>
+        
+        <div class="content">
+            <button class="expand-all" onclick="toggleAllSections()">📂 Expand All Sections</button>
+            
+            """,
+        generate_summary_section(data),
+        """
+            
+            """,
+        *generate_sections(data),
+        """
+        </div>
+        
+        <div class="footer">
+            <p>Report generated by PowerShell System Information Script</p>
+            <p>Converted to HTML by Python Report Converter</p>
+        </div>
+    </div>
     
-    return html_template
+    <script>
+""",
+        REPORT_SCRIPT,
+        """    </script>
+</body>
+</html>"""]
 
 def convert_json_to_html(json_file_path, output_file_path=None):
     """Main conversion function"""
     try:
         # Read JSON file (handle UTF-8 BOM from PowerShell)
-        with open(json_file_path, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+        data = load_json_file(json_file_path)
         
         # Extract computer name and timestamp
         computer_name = "Unknown Computer"
@@ -547,15 +638,16 @@ def convert_json_to_html(json_file_path, output_file_path=None):
         
         # Generate output filename if not provided
         if output_file_path is None:
-            json_path = Path(json_file_path)
-            output_file_path = json_path.parent / f"{json_path.stem}_report.html"
+            json_stem = os.path.splitext(os.path.basename(json_file_path))[0]
+            output_file_path = os.path.join(os.path.dirname(json_file_path), f"{json_stem}_report.html")
         
         # Generate HTML
-        html_content = generate_html_template(data, computer_name, timestamp)
+        html_parts = generate_html_parts(data, computer_name, timestamp)
         
-        # Write HTML file
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Write HTML file, encoding fragment by fragment so the whole page
+        # never exists as both a str and a bytes copy at the same time
+        with open(output_file_path, 'wb') as f:
+            f.writelines(part.encode('utf-8') for part in html_parts)
         
         print(f"✅ Successfully converted JSON to HTML!")
         print(f"📁 Input:  {json_file_path}")
@@ -567,18 +659,48 @@ def convert_json_to_html(json_file_path, output_file_path=None):
     except FileNotFoundError:
         print(f"❌ Error: Could not find JSON file: {json_file_path}")
         return None
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON file - {e}")
         return None
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
 
+def convert_directory(directory):
+    """Convert every JSON report in a folder, returning (converted, failed) counts"""
+    json_files = sorted(path for path, _ in scan_json_dir(directory))
+    
+    converted = 0
+    failed = 0
+    for json_file in json_files:
+        print(f"\n🔄 Converting {json_file}...")
+        if convert_json_to_html(json_file):
+            converted += 1
+        else:
+            failed += 1
+    
+    return converted, failed
+
 def main():
     """Command line interface with interactive prompts"""
     print("🎨 System Report HTML Converter")
     print("=" * 40)
     
+    # Batch mode: convert a whole folder without any prompts
+    if len(sys.argv) >= 2 and sys.argv[1] == '--batch':
+        print("📚 Batch mode detected")
+        if len(sys.argv) < 3 or not os.path.isdir(sys.argv[2]):
+            print("❌ Error: --batch requires an existing folder")
+            sys.exit(1)
+        
+        try:
+            converted, failed = convert_directory(sys.argv[2])
+        except OSError as e:
+            print(f"❌ Error: Could not read folder '{sys.argv[2]}' - {e}")
+            sys.exit(1)
+        print(f"\n🎉 Converted {converted} report(s), {failed} failed")
+        sys.exit(1 if failed else 0)
+    
     # Check if arguments were provided (command line mode)
     if len(sys.argv) >= 2:
         print("📋 Command line mode detected")